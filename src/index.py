@@ -5,16 +5,27 @@ A Model Context Protocol server for Real-Debrid API with OAuth Device Code Flow
 """
 
 import os
+import secrets
+import sys
 import time
-import json
+import functools
+import inspect
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Dict, Optional, Any
-from urllib.parse import urlencode
+from contextlib import asynccontextmanager
 import asyncio
 
 import httpx
+import orjson
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
+from starlette.responses import Response
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
 
 # Real-Debrid API base URLs
 RD_API_BASE = "https://api.real-debrid.com/rest/1.0"
@@ -23,11 +34,335 @@ RD_OAUTH_BASE = "https://api.real-debrid.com/oauth/v2"
 # Default open-source client ID (from Real-Debrid docs)
 DEFAULT_CLIENT_ID = "X245A4XAIBGVM"
 
-# In-memory storage for user tokens (in production, use Redis or database)
-user_tokens: Dict[str, Dict[str, Any]] = {}
+# Grant type for the device flow, shared by both /token calls
+DEVICE_GRANT_TYPE = "http://oauth.net/grant_type/device/1.0"
+
+
+def _json(obj: Any) -> str:
+    """Serialize a tool result compactly with orjson (no pretty-printing)"""
+    return orjson.dumps(obj).decode()
+
+@dataclass(slots=True)
+class Session:
+    """Authenticated Real-Debrid session (slotted: compact, fast attribute access)"""
+    access_token: str
+    refresh_token: str
+    expires_at: float
+    client_id: str
+    client_secret: str
+
+    def to_mapping(self) -> Dict[str, Any]:
+        """Flatten to the field names used in the Redis hash"""
+        return {
+            "accessToken": self.access_token,
+            "refreshToken": self.refresh_token,
+            "expiresAt": self.expires_at,
+            "clientId": self.client_id,
+            "clientSecret": self.client_secret,
+        }
+
+    @classmethod
+    def from_mapping(cls, data: Dict[str, str]) -> "Session":
+        return cls(
+            access_token=data["accessToken"],
+            refresh_token=data["refreshToken"],
+            expires_at=float(data["expiresAt"]),
+            client_id=data["clientId"],
+            client_secret=data["clientSecret"],
+        )
+
+
+# In-memory storage for user tokens (fallback when REDIS_URL is not set)
+user_tokens: Dict[str, Session] = {}
+
+# Lightweight counters; plain int += is atomic under the CPython GIL, so
+# /health and /metrics stay O(1) instead of sizing the session store
+_active_sessions = 0
+_api_requests = 0
+
+# In-memory /user response cache for the no-Redis fallback: {session_id: (expires_at, json)}
+_user_info_cache: Dict[str, tuple] = {}
+
+# Redis session store (enables restarts and horizontal scaling of the SSE server)
+REDIS_URL = os.getenv("REDIS_URL")
+SESSION_KEY_PREFIX = "rd:sess:"
+USER_CACHE_KEY_PREFIX = "rd:user:"
+USER_CACHE_TTL = 60  # seconds
+SESSION_GRACE = 14 * 86400  # keep sessions refreshable for 14 days past token expiry
+
+_redis = aioredis.from_url(REDIS_URL, decode_responses=True) if (REDIS_URL and aioredis) else None
+
+
+async def get_session(session_id: str) -> Optional[Session]:
+    """Fetch a session from Redis (single HGETALL) or the in-memory store"""
+    if _redis is not None:
+        data = await _redis.hgetall(f"{SESSION_KEY_PREFIX}{session_id}")
+        if not data:
+            return None
+        return Session.from_mapping(data)
+    return user_tokens.get(session_id)
+
+
+async def store_session(session_id: str, session: Session) -> None:
+    """Persist a session, pipelining HSET + EXPIRE when backed by Redis"""
+    if _redis is not None:
+        key = f"{SESSION_KEY_PREFIX}{session_id}"
+        async with _redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=session.to_mapping())
+            pipe.expire(key, int(session.expires_at - time.time()) + SESSION_GRACE)
+            await pipe.execute()
+    else:
+        user_tokens[session_id] = session
+
+
+async def get_cached_user_info(session_id: str) -> Optional[str]:
+    """Return the cached /user response for a session, if still fresh"""
+    if _redis is not None:
+        return await _redis.get(f"{USER_CACHE_KEY_PREFIX}{session_id}")
+    cached = _user_info_cache.get(session_id)
+    if cached and time.time() < cached[0]:
+        return cached[1]
+    return None
+
+
+async def cache_user_info(session_id: str, payload: str) -> None:
+    """Cache a /user response for USER_CACHE_TTL seconds"""
+    if _redis is not None:
+        await _redis.set(f"{USER_CACHE_KEY_PREFIX}{session_id}", payload, ex=USER_CACHE_TTL)
+    else:
+        _user_info_cache[session_id] = (time.time() + USER_CACHE_TTL, payload)
+
+
+# Refresh tokens slightly before expiry, and coalesce concurrent refreshes per session
+_SKEW = 60  # seconds
+_refresh_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def ensure_fresh_token(session_id: str) -> str:
+    """Return a valid access token for a session, refreshing it only when needed.
+
+    The common path (token not near expiry) does zero network I/O. When a
+    refresh is needed, a per-session lock with a double-check ensures a burst
+    of concurrent tool calls triggers exactly one refresh round-trip.
+    """
+    session = await get_session(session_id)
+
+    if not session:
+        raise ToolError("Invalid session_id. Please authenticate first using oauth_start and oauth_check.")
+
+    if time.time() < session.expires_at - _SKEW:
+        return session.access_token
+
+    async with _refresh_locks.setdefault(session_id, asyncio.Lock()):
+        # Re-check: another caller may have refreshed while we waited
+        session = await get_session(session_id)
+        if not session:
+            raise ToolError("Invalid session_id. Please authenticate first using oauth_start and oauth_check.")
+        if time.time() < session.expires_at - _SKEW:
+            return session.access_token
+
+        new_tokens = await refresh_access_token(
+            session.client_id,
+            session.client_secret,
+            session.refresh_token
+        )
+        session.access_token = new_tokens["accessToken"]
+        session.refresh_token = new_tokens["refreshToken"]
+        session.expires_at = time.time() + new_tokens["expiresIn"]
+        await store_session(session_id, session)
+        return session.access_token
+
+# Shared HTTP clients (created lazily, reused for connection pooling / keep-alive)
+_api_client: Optional[httpx.AsyncClient] = None
+_oauth_client: Optional[httpx.AsyncClient] = None
+_client_lock = asyncio.Lock()
+
+# Everything talks to api.real-debrid.com: one HTTP/2 connection multiplexes
+# concurrent tool calls, with headroom for bursts of MCP sessions
+_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+
+def _build_client(base_url: str) -> httpx.AsyncClient:
+    """Construct a pooled HTTP/2 client with one retry for transient TCP failures"""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        transport=httpx.AsyncHTTPTransport(retries=1, http2=True, limits=_LIMITS),
+        timeout=30.0,
+        headers={"User-Agent": "rd-mcp/2.0"}
+    )
+
+
+async def get_api_client() -> httpx.AsyncClient:
+    """Get the shared client for REST API calls, creating it on first use"""
+    global _api_client
+    if _api_client is None:
+        async with _client_lock:
+            if _api_client is None:
+                _api_client = _build_client(RD_API_BASE)
+    return _api_client
+
+
+async def get_oauth_client() -> httpx.AsyncClient:
+    """Get the shared client for OAuth calls, creating it on first use"""
+    global _oauth_client
+    if _oauth_client is None:
+        async with _client_lock:
+            if _oauth_client is None:
+                _oauth_client = _build_client(RD_OAUTH_BASE)
+    return _oauth_client
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients on shutdown"""
+    global _api_client, _oauth_client
+    if _api_client is not None:
+        await _api_client.aclose()
+        _api_client = None
+    if _oauth_client is not None:
+        await _oauth_client.aclose()
+        _oauth_client = None
+
+
+_GC_INTERVAL = 300  # seconds between expired-session sweeps
+
+
+async def _sweep_sessions() -> None:
+    """Evict expired state so no per-session structure grows unbounded.
+
+    Sessions themselves expire via EXPIRE when Redis-backed, but the refresh
+    locks and the fallback /user cache are process-local either way and must
+    be pruned here. Without Redis the session store itself is swept too.
+    """
+    global _active_sessions
+    now = time.time()
+    if _redis is None:
+        for session_id, session in list(user_tokens.items()):
+            if session.expires_at + SESSION_GRACE < now:
+                user_tokens.pop(session_id, None)
+                _refresh_locks.pop(session_id, None)
+                _user_info_cache.pop(session_id, None)
+                _active_sessions -= 1
+    else:
+        # Uncontended locks are recreated on demand, so dropping them is safe
+        for session_id, lock in list(_refresh_locks.items()):
+            if not lock.locked():
+                _refresh_locks.pop(session_id, None)
+        # Redis owns session expiry, so recount rd:sess:* to keep the counter
+        # honest across restarts and evictions (oauth_check keeps it live
+        # between sweeps)
+        count = 0
+        async for _ in _redis.scan_iter(match=f"{SESSION_KEY_PREFIX}*", count=500):
+            count += 1
+        _active_sessions = count
+    # Drop stale /user cache entries for sessions that are still alive
+    for session_id, (expires, _) in list(_user_info_cache.items()):
+        if expires < now:
+            _user_info_cache.pop(session_id, None)
+
+
+async def _gc_loop() -> None:
+    """Run the expired-state sweep every _GC_INTERVAL seconds.
+
+    Sweeps once at startup so the Redis-backed session counter is
+    repopulated immediately after a restart.
+    """
+    while True:
+        await _sweep_sessions()
+        await asyncio.sleep(_GC_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """FastMCP lifespan: run the session sweeper and clean up on shutdown"""
+    gc_task = asyncio.create_task(_gc_loop())
+    try:
+        yield
+    finally:
+        gc_task.cancel()
+        await close_http_clients()
+
 
 # Initialize FastMCP server
-mcp = FastMCP("real-debrid-mcp-oauth")
+mcp = FastMCP("real-debrid-mcp-oauth", lifespan=lifespan)
+
+
+# Prebuilt URL objects for the fixed endpoints, so httpx skips re-parsing
+# the path on every call; merged against the client's base_url
+_URLS = {
+    endpoint: httpx.URL(endpoint)
+    for endpoint in ("/user", "/torrents", "/torrents?filter=active",
+                     "/torrents/addMagnet", "/unrestrict/link")
+}
+
+
+def _endpoint_url(endpoint: str) -> httpx.URL:
+    """Look up a prebuilt URL, parsing only endpoints not seen at import time"""
+    url = _URLS.get(endpoint)
+    return url if url is not None else httpx.URL(endpoint)
+
+
+def _parse_api_response(response: httpx.Response) -> Any:
+    """Turn a Real-Debrid API response into data or a raised error"""
+    if response.status_code >= 400:
+        if not response.content:
+            raise Exception(f"Real-Debrid API Error: HTTP {response.status_code} (empty body)")
+        data = orjson.loads(response.content)
+        error_msg = data.get("error", "Unknown error")
+        error_code = data.get("error_code", "N/A")
+        raise Exception(f"Real-Debrid API Error: {error_msg} (Code: {error_code})")
+
+    if response.status_code == 204 or not response.content:
+        return {"success": True}
+
+    return orjson.loads(response.content)
+
+
+async def _rd_api_get(endpoint: str, access_token: str) -> Any:
+    """Perform a single upstream GET against the REST API"""
+    client = await get_api_client()
+    response = await client.get(_endpoint_url(endpoint), headers={"Authorization": f"Bearer {access_token}"})
+    return _parse_api_response(response)
+
+
+class RDRequestCoalescer:
+    """Coalesce identical concurrent GET requests into one upstream call.
+
+    While a GET for a given (endpoint, token) is in flight, every other
+    caller asking for the same thing awaits the same task instead of
+    issuing its own HTTPS round-trip. GETs are read-only, so all waiters
+    can safely share one result. The upstream call runs in its own task
+    and each caller awaits it shielded, so cancelling any one caller
+    (including the first) never strands the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[tuple, "asyncio.Task[Any]"] = {}
+
+    async def fetch(self, endpoint: str, access_token: str) -> Any:
+        key = (endpoint, hash(access_token))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(_rd_api_get(endpoint, access_token))
+            self._inflight[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._inflight.pop(key, None)
+
+
+_coalescer = RDRequestCoalescer()
+
+
+async def _rd_api_send(endpoint: str, access_token: str, method: str, body: Optional[Dict[str, Any]]) -> Any:
+    """Perform a mutating request (POST/PUT/DELETE) against the REST API"""
+    client = await get_api_client()
+    response = await client.request(
+        method,
+        _endpoint_url(endpoint),
+        headers={"Authorization": f"Bearer {access_token}"},
+        data=body
+    )
+    return _parse_api_response(response)
 
 
 async def rd_api_request(
@@ -37,119 +372,86 @@ async def rd_api_request(
     body: Optional[Dict[str, Any]] = None
 ) -> Any:
     """Helper function to make Real-Debrid API requests with OAuth"""
-    url = f"{RD_API_BASE}{endpoint}"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-    }
-    
-    async with httpx.AsyncClient() as client:
-        if method == "GET":
-            response = await client.get(url, headers=headers)
-        else:
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
-            data = urlencode(body) if body else None
-            response = await client.request(method, url, headers=headers, content=data)
-        
-        if response.status_code == 204:
-            return {"success": True}
-        
-        data = response.json()
-        
-        if response.status_code >= 400:
-            error_msg = data.get("error", "Unknown error")
-            error_code = data.get("error_code", "N/A")
-            raise Exception(f"Real-Debrid API Error: {error_msg} (Code: {error_code})")
-        
-        return data
+    global _api_requests
+    _api_requests += 1
+
+    # Read-only GETs are deduplicated; mutating requests always go upstream
+    if method == "GET":
+        return await _coalescer.fetch(endpoint, access_token)
+    return await _rd_api_send(endpoint, access_token, method, body)
 
 
 async def initiate_device_auth() -> Dict[str, Any]:
     """Start OAuth Device Code Flow"""
-    url = f"{RD_OAUTH_BASE}/device/code?client_id={DEFAULT_CLIENT_ID}&new_credentials=yes"
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        data = response.json()
-        
-        return {
-            "deviceCode": data["device_code"],
-            "userCode": data["user_code"],
-            "verificationUrl": data["verification_url"],
-            "expiresIn": data["expires_in"],
-            "interval": data["interval"]
-        }
+    client = await get_oauth_client()
+    response = await client.get(f"/device/code?client_id={DEFAULT_CLIENT_ID}&new_credentials=yes")
+    data = orjson.loads(response.content)
+
+    return {
+        "deviceCode": data["device_code"],
+        "userCode": data["user_code"],
+        "verificationUrl": data["verification_url"],
+        "expiresIn": data["expires_in"],
+        "interval": data["interval"]
+    }
 
 
 async def get_device_credentials(device_code: str) -> Optional[Dict[str, str]]:
     """Get device credentials after user authorization"""
-    url = f"{RD_OAUTH_BASE}/device/credentials?client_id={DEFAULT_CLIENT_ID}&code={device_code}"
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        
-        if response.status_code != 200:
-            return None  # User hasn't authorized yet
-        
-        data = response.json()
-        return {
-            "clientId": data["client_id"],
-            "clientSecret": data["client_secret"]
-        }
+    client = await get_oauth_client()
+    response = await client.get(f"/device/credentials?client_id={DEFAULT_CLIENT_ID}&code={device_code}")
+
+    if response.status_code != 200:
+        return None  # User hasn't authorized yet
+
+    data = orjson.loads(response.content)
+    return {
+        "clientId": data["client_id"],
+        "clientSecret": data["client_secret"]
+    }
 
 
 async def get_access_token(client_id: str, client_secret: str, device_code: str) -> Optional[Dict[str, Any]]:
     """Get access token using device code"""
-    url = f"{RD_OAUTH_BASE}/token"
-    
     payload = {
         "client_id": client_id,
         "client_secret": client_secret,
         "code": device_code,
-        "grant_type": "http://oauth.net/grant_type/device/1.0"
+        "grant_type": DEVICE_GRANT_TYPE
+    }
+
+    client = await get_oauth_client()
+    response = await client.post("/token", data=payload)
+
+    if response.status_code != 200:
+        return None
+
+    data = orjson.loads(response.content)
+    return {
+        "accessToken": data["access_token"],
+        "refreshToken": data["refresh_token"],
+        "expiresIn": data["expires_in"]
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            content=urlencode(payload)
-        )
-        
-        if response.status_code != 200:
-            return None
-        
-        data = response.json()
-        return {
-            "accessToken": data["access_token"],
-            "refreshToken": data["refresh_token"],
-            "expiresIn": data["expires_in"]
-        }
 
 
 async def refresh_access_token(client_id: str, client_secret: str, refresh_token: str) -> Dict[str, Any]:
     """Refresh access token"""
-    url = f"{RD_OAUTH_BASE}/token"
-    
     payload = {
         "client_id": client_id,
         "client_secret": client_secret,
         "code": refresh_token,
-        "grant_type": "http://oauth.net/grant_type/device/1.0"
+        "grant_type": DEVICE_GRANT_TYPE
+    }
+
+    client = await get_oauth_client()
+    response = await client.post("/token", data=payload)
+
+    data = orjson.loads(response.content)
+    return {
+        "accessToken": data["access_token"],
+        "refreshToken": data["refresh_token"],
+        "expiresIn": data["expires_in"]
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            content=urlencode(payload)
-        )
-        
-        data = response.json()
-        return {
-            "accessToken": data["access_token"],
-            "refreshToken": data["refresh_token"],
-            "expiresIn": data["expires_in"]
-        }
 
 
 # OAuth Tools
@@ -167,16 +469,34 @@ async def oauth_start() -> str:
         "instructions": "Then use oauth_check with the device_code to complete authentication"
     }
     
-    return json.dumps(result, indent=2)
+    return _json(result)
 
 
 @mcp.tool()
 async def oauth_check(device_code: str) -> str:
     """Check if OAuth authorization is complete and get access token
-    
+
     Args:
         device_code: Device code from oauth_start
     """
+    # Coalesce concurrent polls for the same device_code into one upstream check,
+    # so polling loops never hit Real-Debrid more than once per interval
+    task = _oauth_checks_in_flight.get(device_code)
+    if task is None:
+        task = asyncio.create_task(_do_oauth_check(device_code))
+        _oauth_checks_in_flight[device_code] = task
+    try:
+        return await asyncio.shield(task)
+    finally:
+        _oauth_checks_in_flight.pop(device_code, None)
+
+
+# In-flight oauth_check tasks, keyed by device_code
+_oauth_checks_in_flight: Dict[str, "asyncio.Task[str]"] = {}
+
+
+async def _do_oauth_check(device_code: str) -> str:
+    """Perform one credentials + token round against Real-Debrid"""
     # Get device credentials
     credentials = await get_device_credentials(device_code)
     if not credentials:
@@ -184,7 +504,7 @@ async def oauth_check(device_code: str) -> str:
             "status": "pending",
             "message": "User has not authorized yet. Please complete authorization at real-debrid.com/device"
         }
-        return json.dumps(result, indent=2)
+        return _json(result)
     
     # Get access token
     tokens = await get_access_token(credentials["clientId"], credentials["clientSecret"], device_code)
@@ -193,18 +513,20 @@ async def oauth_check(device_code: str) -> str:
             "status": "pending",
             "message": "Authorization in progress. Please try again in a few seconds."
         }
-        return json.dumps(result, indent=2)
-    
-    # Generate session ID and store tokens
-    session_id = f"session_{int(time.time())}_{os.urandom(4).hex()}"
-    user_tokens[session_id] = {
-        "accessToken": tokens["accessToken"],
-        "refreshToken": tokens["refreshToken"],
-        "expiresAt": time.time() + tokens["expiresIn"],
-        "clientId": credentials["clientId"],
-        "clientSecret": credentials["clientSecret"]
-    }
+        return _json(result)
     
+    # Generate session ID and store tokens (opaque, collision-free)
+    global _active_sessions
+    session_id = "s_" + secrets.token_urlsafe(16)
+    _active_sessions += 1
+    await store_session(session_id, Session(
+        access_token=tokens["accessToken"],
+        refresh_token=tokens["refreshToken"],
+        expires_at=time.time() + tokens["expiresIn"],
+        client_id=credentials["clientId"],
+        client_secret=credentials["clientSecret"]
+    ))
+
     result = {
         "status": "authorized",
         "session_id": session_id,
@@ -212,151 +534,193 @@ async def oauth_check(device_code: str) -> str:
         "expires_in": tokens["expiresIn"]
     }
     
-    return json.dumps(result, indent=2)
+    return _json(result)
+
+
+def require_session(fn):
+    """Resolve a fresh access token once before the tool body runs.
+
+    The wrapped tool declares a keyword-only `access_token` parameter that is
+    filled in here; the published signature omits it so it never appears in
+    the MCP tool schema. Centralizes the session lookup / refresh / raise
+    that each tool previously repeated inline.
+    """
+    sig = inspect.signature(fn)
+    public = sig.replace(
+        parameters=[p for name, p in sig.parameters.items() if name != "access_token"]
+    )
+
+    @functools.wraps(fn)
+    async def wrapper(session_id: str, *args, **kwargs):
+        access_token = await ensure_fresh_token(session_id)
+        return await fn(session_id, *args, access_token=access_token, **kwargs)
+
+    wrapper.__signature__ = public
+    return wrapper
 
 
 # Real-Debrid API Tools
 @mcp.tool()
-async def get_user_info(session_id: str) -> str:
+@require_session
+async def get_user_info(session_id: str, *, access_token: str) -> str:
     """Get current Real-Debrid user information
-    
+
     Args:
         session_id: Session ID from oauth_check
     """
-    session = user_tokens.get(session_id)
-    
-    if not session:
-        raise ToolError("Invalid session_id. Please authenticate first using oauth_start and oauth_check.")
-    
-    # Check if token needs refresh
-    if time.time() >= session["expiresAt"]:
-        new_tokens = await refresh_access_token(
-            session["clientId"],
-            session["clientSecret"],
-            session["refreshToken"]
-        )
-        session["accessToken"] = new_tokens["accessToken"]
-        session["refreshToken"] = new_tokens["refreshToken"]
-        session["expiresAt"] = time.time() + new_tokens["expiresIn"]
-        user_tokens[session_id] = session
-    
-    data = await rd_api_request("/user", session["accessToken"])
-    return json.dumps(data, indent=2)
+    cached = await get_cached_user_info(session_id)
+    if cached is not None:
+        return cached
+
+    data = await rd_api_request("/user", access_token)
+    payload = _json(data)
+    await cache_user_info(session_id, payload)
+    return payload
 
 
 @mcp.tool()
-async def unrestrict_link(session_id: str, link: str, password: Optional[str] = None) -> str:
+@require_session
+async def unrestrict_link(session_id: str, link: str, password: Optional[str] = None, *, access_token: str) -> str:
     """Unrestrict a hoster link
-    
+
     Args:
         session_id: Session ID from OAuth
         link: The hoster link to unrestrict
         password: Optional password for protected files
     """
-    session = user_tokens.get(session_id)
-    
-    if not session:
-        raise ToolError("Invalid session_id. Please authenticate first.")
-    
     body = {"link": link}
     if password:
         body["password"] = password
-    
-    data = await rd_api_request("/unrestrict/link", session["accessToken"], "POST", body)
-    return json.dumps(data, indent=2)
+
+    data = await rd_api_request("/unrestrict/link", access_token, "POST", body)
+    return _json(data)
+
+
+# Precomputed /torrents endpoints for the filters Real-Debrid supports
+_TORRENTS_ENDPOINTS = {None: "/torrents", "active": "/torrents?filter=active"}
 
 
 @mcp.tool()
-async def list_torrents(session_id: str, filter: Optional[str] = None) -> str:
+@require_session
+async def list_torrents(session_id: str, filter: Optional[str] = None, *, access_token: str) -> str:
     """Get user's torrents list
-    
+
     Args:
         session_id: Session ID from OAuth
         filter: Filter: 'active' for active torrents only
     """
-    session = user_tokens.get(session_id)
-    
-    if not session:
-        raise ToolError("Invalid session_id. Please authenticate first.")
-    
-    endpoint = "/torrents"
-    if filter:
-        endpoint += f"?filter={filter}"
-    
-    data = await rd_api_request(endpoint, session["accessToken"])
-    return json.dumps(data, indent=2)
+    endpoint = _TORRENTS_ENDPOINTS.get(filter)
+    if endpoint is None:
+        raise ToolError("Invalid filter. Use 'active' or omit the filter.")
+
+    data = await rd_api_request(endpoint, access_token)
+    return _json(data)
 
 
 @mcp.tool()
-async def add_magnet(session_id: str, magnet: str) -> str:
+@require_session
+async def add_magnet(session_id: str, magnet: str, *, access_token: str) -> str:
     """Add a magnet link
-    
+
     Args:
         session_id: Session ID from OAuth
         magnet: The magnet link
     """
-    session = user_tokens.get(session_id)
-    
-    if not session:
-        raise ToolError("Invalid session_id. Please authenticate first.")
-    
-    data = await rd_api_request("/torrents/addMagnet", session["accessToken"], "POST", {"magnet": magnet})
-    return json.dumps(data, indent=2)
+    data = await rd_api_request("/torrents/addMagnet", access_token, "POST", {"magnet": magnet})
+    return _json(data)
+
+
+# Static server-info payload, serialized once at import time
+_ROOT_BODY = orjson.dumps({
+    "name": "Real-Debrid MCP Server (OAuth)",
+    "version": "2.0.0",
+    "status": "running",
+    "transport": "HTTP/SSE",
+    "authentication": "OAuth Device Code Flow",
+    "endpoints": {
+        "root": "/",
+        "health": "/health",
+        "metrics": "/metrics",
+        "sse": "/sse (MCP connection endpoint)",
+    },
+    "usage": "Use oauth_start tool to begin authentication",
+    "tools": 6
+})
 
 
 # Add custom routes
 @mcp.custom_route("/", methods=["GET"])
 async def root(request):
     """Root endpoint with server information"""
-    from starlette.responses import JSONResponse
-    return JSONResponse({
-        "name": "Real-Debrid MCP Server (OAuth)",
-        "version": "2.0.0",
-        "status": "running",
-        "transport": "HTTP/SSE",
-        "authentication": "OAuth Device Code Flow",
-        "endpoints": {
-            "root": "/",
-            "health": "/health",
-            "sse": "/sse (MCP connection endpoint)",
-        },
-        "usage": "Use oauth_start tool to begin authentication",
-        "tools": 6
-    })
+    return Response(_ROOT_BODY, media_type="application/json")
+
+
+# /health timestamp cached with 1-second granularity: (unix_time, iso_string)
+_health_ts: tuple = (0.0, "")
+
+
+def _health_timestamp() -> str:
+    """Current UTC timestamp string, recomputed at most once per second"""
+    global _health_ts
+    t = time.time()
+    if t - _health_ts[0] > 1.0:
+        _health_ts = (t, datetime.fromtimestamp(t, timezone.utc).isoformat() + "Z")
+    return _health_ts[1]
 
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health(request):
     """Health check endpoint"""
-    from starlette.responses import JSONResponse
-    return JSONResponse({
+    return Response(orjson.dumps({
         "status": "healthy",
         "service": "real-debrid-mcp-oauth",
-        "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
-        "activeSessions": len(user_tokens)
-    })
+        "timestamp": _health_timestamp(),
+        "activeSessions": _active_sessions
+    }), media_type="application/json")
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request):
+    """Lightweight counters for monitoring"""
+    return Response(orjson.dumps({
+        "activeSessions": _active_sessions,
+        "apiRequests": _api_requests
+    }), media_type="application/json")
 
 
 # Main entry point for SSE transport
 def main():
     """Start the FastMCP server with SSE transport"""
+    # Use uvloop when available (Linux/macOS) for faster async I/O
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Get port from environment or use default
     port = int(os.getenv("PORT", "3000"))
     
-    print("=" * 60)
-    print(" REAL-DEBRID MCP SERVER (OAuth) STARTED")
-    print("=" * 60)
-    print(f" Transport:     HTTP/SSE (Railway-compatible)")
-    print(f" Auth Method:   OAuth Device Code Flow")
-    print(f" Port:          {port}")
-    print(f" Health Check:  http://localhost:{port}/health")
-    print(f" SSE Endpoint:  http://localhost:{port}/sse")
-    print(f" Tools:         6 Real-Debrid tools available")
-    print(f" Started:       {datetime.now(timezone.utc).isoformat()}Z")
-    print("=" * 60)
-    print(" Users authenticate via oauth_start tool!")
-    print("=" * 60)
-    
+    # One write + flush instead of 13 line-buffered print calls
+    bar = "=" * 60
+    sys.stdout.write(
+        f"{bar}\n"
+        f" REAL-DEBRID MCP SERVER (OAuth) STARTED\n"
+        f"{bar}\n"
+        f" Transport:     HTTP/SSE (Railway-compatible)\n"
+        f" Auth Method:   OAuth Device Code Flow\n"
+        f" Port:          {port}\n"
+        f" Health Check:  http://localhost:{port}/health\n"
+        f" SSE Endpoint:  http://localhost:{port}/sse\n"
+        f" Tools:         6 Real-Debrid tools available\n"
+        f" Started:       {datetime.now(timezone.utc).isoformat()}Z\n"
+        f"{bar}\n"
+        f" Users authenticate via oauth_start tool!\n"
+        f"{bar}\n"
+    )
+    sys.stdout.flush()
+
+
     # Start the server with SSE transport
     mcp.run(transport="sse", host="0.0.0.0", port=port)
 